@@ -9,13 +9,20 @@ emulator modes for development/testing.
 Usage:
     python ntpclock.py --emulator    # Run with Tkinter emulator
     python ntpclock.py               # Run on actual hardware (Raspberry Pi)
+
+The clock itself composes frames from pre-rendered row bitmasks and does
+not draw through ImageDraw. canvas(), CanvasContext, draw_char and
+draw_time_string are kept for external callers that want to draw on a
+device. On the emulator, such drawing only reaches the screen from
+within root.mainloop().
 """
 
-import argparse
+import signal
 import time
 import sys
-from datetime import datetime
+from types import SimpleNamespace
 
+import PIL
 from PIL import Image, ImageDraw
 
 
@@ -36,16 +43,32 @@ DIGIT_FONT = {
     ':': [0b0, 0b0, 0b1, 0b0, 0b1, 0b0, 0b0],  # Colon separator (1 pixel wide)
 }
 
+# DIGIT_FONT flattened into byte tables for draw_char's lookups:
+# CHAR_INDEX[ord(char)] is the glyph slot (or NO_GLYPH), and each slot owns
+# GLYPH_HEIGHT consecutive row bitmaps in GLYPH_ROWS.
+GLYPH_CHARS = '0123456789:'
+GLYPH_HEIGHT = 7
+NO_GLYPH = 0xFF
+CHAR_INDEX = bytes(
+    GLYPH_CHARS.index(chr(code)) if chr(code) in GLYPH_CHARS else NO_GLYPH
+    for code in range(256)
+)
+GLYPH_ROWS = bytes(row for char in GLYPH_CHARS for row in DIGIT_FONT[char])
+GLYPH_WIDTHS = bytes(3 if char.isdigit() else 1 for char in GLYPH_CHARS)
+
 
 def draw_char(draw, x, y, char, fill="white"):
     """Draw a single character from the custom font at position (x, y)."""
-    if char not in DIGIT_FONT:
+    code = ord(char)
+    idx = CHAR_INDEX[code] if code < 256 else NO_GLYPH
+    if idx == NO_GLYPH:
         return 0
 
-    pattern = DIGIT_FONT[char]
-    width = 3 if char.isdigit() else 1
+    width = GLYPH_WIDTHS[idx]
+    base = idx * GLYPH_HEIGHT
 
-    for row_idx, row in enumerate(pattern):
+    for row_idx in range(GLYPH_HEIGHT):
+        row = GLYPH_ROWS[base + row_idx]
         for col_idx in range(width):
             bit_pos = width - 1 - col_idx
             if row & (1 << bit_pos):
@@ -69,24 +92,217 @@ def draw_time_string(draw, time_str, y_offset=0):
     x = 2  # Center the 27px content on 32px display
 
     for char in time_str:
-        if char in DIGIT_FONT:
-            width = draw_char(draw, x, y_offset, char)
+        width = draw_char(draw, x, y_offset, char)
+        if width:
             x += width + 1  # Add 1 pixel spacing after each character
 
 
+# Fixed x positions within the 32px frame, matching draw_time_string's layout
+HH_X, MM_X, SS_X = 2, 12, 22
+COLON_X = (10, 20)
+
+# Zero-padded "00".."59" strings, so formatting a time is just lookups
+TWO_DIGIT = tuple(f"{i:02d}" for i in range(60))
+
+# How far past each second boundary run_clock wakes, so the new second is visible
+SECOND_SLACK = 0.002
+
+# Brightness used when none is given on the command line
+DEFAULT_BRIGHTNESS = 128
+
+
+def segment_rows(text, x, width=32, height=8):
+    """
+    Render text at column x as per-row bitmasks for a width-pixel frame.
+
+    Bit (width - 1 - col) of each row is the pixel at column col, so
+    segments placed at different offsets can be combined with a bitwise OR.
+    Uses the same spacing as draw_time_string.
+    """
+    rows = [0] * height
+
+    for char in text:
+        code = ord(char)
+        idx = CHAR_INDEX[code] if code < 256 else NO_GLYPH
+        if idx == NO_GLYPH:
+            continue
+
+        glyph_width = GLYPH_WIDTHS[idx]
+        base = idx * GLYPH_HEIGHT
+        shift = width - x - glyph_width
+        for row_idx in range(GLYPH_HEIGHT):
+            rows[row_idx] |= GLYPH_ROWS[base + row_idx] << shift
+        x += glyph_width + 1
+
+    return tuple(rows)
+
+
+class SegmentCache:
+    """
+    Pre-rendered HH, MM and SS row bitmasks for composing clock frames.
+
+    Built once at startup so each tick is a handful of integer ORs and a
+    single Image.frombuffer rather than ~170 ImageDraw.point calls.
+    """
+
+    def __init__(self, width=32, height=8):
+        self.width = width
+        self.height = height
+        # Row bytes in a mode '1' image; rows are padded to a whole byte
+        self.stride = (width + 7) // 8
+        self.hours = [segment_rows(TWO_DIGIT[h], HH_X, width, height) for h in range(24)]
+        self.minutes = [segment_rows(TWO_DIGIT[m], MM_X, width, height) for m in range(60)]
+        self.seconds = [segment_rows(TWO_DIGIT[s], SS_X, width, height) for s in range(60)]
+        self.colons = tuple(
+            left | right for left, right in zip(
+                segment_rows(':', COLON_X[0], width, height),
+                segment_rows(':', COLON_X[1], width, height),
+            )
+        )
+
+    def frame_rows(self, hour, minute, second):
+        """Return the per-row bitmasks (see segment_rows) for the given time."""
+        return tuple(
+            hh | mm | ss | colon
+            for hh, mm, ss, colon in zip(
+                self.hours[hour], self.minutes[minute], self.seconds[second], self.colons
+            )
+        )
+
+    def pack_rows(self, rows):
+        """Pack per-row bitmasks into mode '1' pixel data."""
+        pad = self.stride * 8 - self.width
+        return b''.join((row << pad).to_bytes(self.stride, 'big') for row in rows)
+
+    def image(self, rows):
+        """Return a mode '1' image of the given per-row bitmasks."""
+        return Image.frombuffer(
+            '1', (self.width, self.height), self.pack_rows(rows), 'raw', '1', 0, 1
+        )
+
+    def frame(self, hour, minute, second):
+        """Return a mode '1' image showing the given time."""
+        return self.image(self.frame_rows(hour, minute, second))
+
+
+class RecordingSerial:
+    """
+    Stand-in luma serial interface that records data() writes.
+
+    Lets a luma device render frames without anything reaching SPI.
+    """
+
+    def __init__(self):
+        self.writes = []
+
+    def command(self, *cmd):
+        pass
+
+    def data(self, data):
+        self.writes.append(bytes(data))
+
+    def cleanup(self):
+        pass
+
+
+class RegisterFrameCache:
+    """
+    Pre-recorded MAX7219 register writes for each HH, MM and SS segment.
+
+    Each segment is rendered once through recorder, a max7219 configured
+    like device but attached to the RecordingSerial recording, so block
+    orientation and cascade order are handled by luma exactly as usual. On
+    the MAX7219 every data() write is a digit address plus a byte of pixels,
+    and the addresses are the same for every frame, so a whole frame is the
+    bitwise OR of its segments' writes. Each tick becomes a few integer ORs
+    plus the SPI transfers, bypassing PIL and luma's render. This does not
+    hold for devices that also send command() writes when displaying (e.g.
+    ssd1306).
+    """
+
+    def __init__(self, device, recorder, recording, segments):
+        self.device = device
+        self.recorder = recorder
+        self.recording = recording
+
+        # Every frame is sent as the same sequence of equally sized writes
+        self.colons = self._record(segments, segments.colons)
+        self.chunk_size = len(recording.writes[0])
+        self.total_size = sum(len(chunk) for chunk in recording.writes)
+
+        self.hours = [self._record(segments, rows) for rows in segments.hours]
+        self.minutes = [self._record(segments, rows) for rows in segments.minutes]
+        self.seconds = [self._record(segments, rows) for rows in segments.seconds]
+        self._last = None
+
+    def _record(self, segments, rows):
+        """Return the bytes display() sends for rows, as one int."""
+        writes = self.recording.writes
+        writes.clear()
+        self.recorder.display(segments.image(rows))
+        return int.from_bytes(b''.join(writes), 'big')
+
+    def write(self, hour, minute, second):
+        """Send the register writes for the given time straight to the device."""
+        # Skip the SPI transfer when the frame is unchanged
+        frame = self.hours[hour] | self.minutes[minute] | self.seconds[second] | self.colons
+        if frame == self._last:
+            return
+        self._last = frame
+
+        buf = frame.to_bytes(self.total_size, 'big')
+        for i in range(0, self.total_size, self.chunk_size):
+            self.device.data(list(buf[i:i + self.chunk_size]))
+
+
+class CanvasContext:
+    """
+    Context manager that mimics luma.core.render.canvas behavior.
+
+    Draws into the emulator's reusable back buffer rather than allocating a
+    new image and ImageDraw per frame.
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self.image = None
+
+    def __enter__(self):
+        self.image, draw = self.device._back_buffer()
+        return draw
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.device.display(self.image)
+        return False
+
+
+def canvas(device):
+    """Create a canvas context for drawing on the device."""
+    factory = getattr(device, 'canvas_factory', None)
+    if factory is None:
+        # Hardware devices draw through luma's own canvas
+        from luma.core.render import canvas as factory
+    return factory(device)
+
+
 class TkinterEmulator:
     """
     A simple Tkinter-based LED matrix emulator.
-    Displays pixels as circles to simulate LED dots.
+    Displays pixels as circles to simulate LED dots, drawn into a single
+    PhotoImage on the canvas.
     """
 
-    def __init__(self, width=32, height=8, scale=15, led_color='red', bg_color='#1a1a1a'):
+    canvas_factory = CanvasContext
+
+    def __init__(self, width=32, height=8, scale=15, led_color='red', bg_color='#1a1a1a',
+                 off_color='#2a2a2a'):
         import tkinter as tk
 
         self.width = width
         self.height = height
         self.scale = scale
         self.led_color = led_color
+        self.off_color = off_color
         self.bg_color = bg_color
         self.mode = '1'
 
@@ -110,52 +326,127 @@ class TkinterEmulator:
         )
         self.canvas.pack(padx=10, pady=10)
 
-        # Pre-create LED circles for efficiency
-        self.leds = []
-        led_radius = scale // 2 - 2
-        for y in range(height):
-            row = []
-            for x in range(width):
-                cx = padding + x * scale + scale // 2
-                cy = padding + y * scale + scale // 2
-                led = self.canvas.create_oval(
-                    cx - led_radius, cy - led_radius,
-                    cx + led_radius, cy + led_radius,
-                    fill='#2a2a2a',  # Off state (dim)
-                    outline='#1a1a1a'
-                )
-                row.append(led)
-            self.leds.append(row)
+        # All LEDs live in a single PhotoImage, so Tk composites one canvas
+        # item instead of 256 ovals. The on and off LEDs are small scale x
+        # scale sprites with a circular dot, copied in only when an LED changes.
+        self.photo = tk.PhotoImage(width=width * scale, height=height * scale)
+        self.canvas.create_image(padding, padding, image=self.photo, anchor='nw')
+        self._on_sprite = tk.PhotoImage(width=scale, height=scale)
+        self._off_sprite = tk.PhotoImage(width=scale, height=scale)
+        self._paint_sprite(self._on_sprite, led_color)
+        self._paint_sprite(self._off_sprite, off_color)
+
+        # Last frame shown as per-row bitmasks, plus the (x, y) of lit LEDs,
+        # so display_rows() only touches LEDs that changed
+        self._rows = [0] * height
+        self.on_set = set()
+        self._copy_leds(
+            ((x, y) for y in range(height) for x in range(width)), self._off_sprite
+        )
+
+        # Back buffer for CanvasContext, created on first use
+        self._frame = None
+        self._frame_draw = None
 
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._running = True
 
+    def _paint_sprite(self, sprite, color):
+        """Draw one LED cell, a dot of color on the background, into sprite."""
+        center = self.scale // 2
+        radius_sq = (self.scale // 2 - 2 + 0.5) ** 2
+        sprite.put(tuple(
+            tuple(
+                color if (px - center) ** 2 + (py - center) ** 2 <= radius_sq else self.bg_color
+                for px in range(self.scale)
+            )
+            for py in range(self.scale)
+        ))
+
+    def _copy_leds(self, positions, sprite):
+        """Copy sprite to each (x, y) LED position with a single Tcl eval."""
+        scale = self.scale
+        copy = f'{self.photo} copy {sprite} -to '
+        script = '\n'.join(f'{copy}{x * scale} {y * scale}' for x, y in positions)
+        if script:
+            self.root.tk.eval(script)
+
+    def _back_buffer(self):
+        """Return the cleared back buffer image and its ImageDraw."""
+        if self._frame is None:
+            self._frame = Image.new(self.mode, (self.width, self.height), 0)
+            self._frame_draw = ImageDraw.Draw(self._frame)
+        else:
+            self._frame.paste(0, (0, 0, self.width, self.height))
+        return self._frame, self._frame_draw
+
     def _on_close(self):
         self._running = False
         self.root.destroy()
 
     def display(self, image):
-        """Update the display with a PIL Image."""
-        if not self._running:
-            raise KeyboardInterrupt("Window closed")
-
-        # Convert to 1-bit if needed
-        if image.mode != '1':
-            image = image.convert('1')
-
-        pixels = image.load()
-
-        for y in range(self.height):
-            for x in range(self.width):
-                pixel = pixels[x, y]
-                # In mode '1': 255 = white (on), 0 = black (off)
-                if pixel:
-                    self.canvas.itemconfig(self.leds[y][x], fill=self.led_color)
+        """
+        Update the display with a PIL Image.
+
+        Like the luma devices, the image must already be in this device's
+        mode ('1') and size; no conversion is done here. Changes are drawn
+        by Tk's event loop, so call this from within root.mainloop().
+        """
+        assert image.mode == self.mode, f"Expected mode '{self.mode}', got '{image.mode}'"
+
+        # Mode '1' packs 8 pixels per byte, MSB first, each row byte-aligned
+        raw = image.tobytes()
+        stride = (self.width + 7) // 8
+        pad = stride * 8 - self.width
+
+        self.display_rows([
+            int.from_bytes(raw[y * stride:(y + 1) * stride], 'big') >> pad
+            for y in range(self.height)
+        ])
+
+    def display_rows(self, rows):
+        """
+        Update the display from per-row bitmasks, as built by SegmentCache.
+
+        Bit (width - 1 - x) of rows[y] is the pixel at (x, y). Only LEDs whose
+        bit differs from the previous frame are repainted, with one Tcl script
+        per sprite rather than one call per LED.
+        """
+        turned_on = []
+        turned_off = []
+
+        # Bind attributes and methods to locals for the per-pixel loop
+        light = self.on_set.add
+        unlight = self.on_set.discard
+        prev_rows = self._rows
+        width = self.width
+
+        for y, row in enumerate(rows):
+            changed = row ^ prev_rows[y]
+            if not changed:
+                continue
+            prev_rows[y] = row
+
+            while changed:
+                bit = changed & -changed  # Lowest flipped pixel
+                changed ^= bit
+                led = (width - bit.bit_length(), y)
+                if row & bit:
+                    turned_on.append(led)
+                    light(led)
                 else:
-                    self.canvas.itemconfig(self.leds[y][x], fill='#2a2a2a')
+                    turned_off.append(led)
+                    unlight(led)
 
-        self.root.update()
+        # Tk redraws the changed region itself once the event loop is idle
+        self._copy_leds(turned_on, self._on_sprite)
+        self._copy_leds(turned_off, self._off_sprite)
+
+    def schedule_tick(self, callback):
+        """Schedule callback to run by Tk just after the next second boundary."""
+        ms = int((1.0 - (time.time() % 1.0) + SECOND_SLACK) * 1000)
+        self.root.after(ms, callback)
 
     def cleanup(self):
         """Clean up resources."""
@@ -167,27 +458,17 @@ class TkinterEmulator:
         """Adjust LED brightness (approximate with color intensity)."""
         intensity = int((value / 255) * 255)
         self.led_color = f'#{intensity:02x}0000'
+        self._paint_sprite(self._on_sprite, self.led_color)
+        # Copied pixels don't track the sprite, so re-copy the lit LEDs
+        self._copy_leds(self.on_set, self._on_sprite)
 
 
-class CanvasContext:
-    """Context manager that mimics luma.core.render.canvas behavior."""
-
-    def __init__(self, device):
-        self.device = device
-        self.image = Image.new('1', (device.width, device.height), 0)
-        self.draw = ImageDraw.Draw(self.image)
-
-    def __enter__(self):
-        return self.draw
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.device.display(self.image)
-        return False
-
-
-def canvas(device):
-    """Create a canvas context for drawing on the device."""
-    return CanvasContext(device)
+MAX7219_OPTIONS = dict(
+    cascaded=4,
+    block_orientation=-90,
+    rotate=0,
+    blocks_arranged_in_reverse_order=False
+)
 
 
 def get_device(emulator=False, width=32, height=8):
@@ -208,72 +489,107 @@ def get_device(emulator=False, width=32, height=8):
     else:
         from luma.core.interface.serial import spi, noop
         from luma.led_matrix.device import max7219
-        from luma.core.render import canvas as luma_canvas
-
-        # Replace our canvas with luma's canvas for hardware mode
-        global canvas
-        canvas = luma_canvas
 
         serial = spi(port=0, device=0, gpio=noop())
-        device = max7219(
-            serial,
-            cascaded=4,
-            block_orientation=-90,
-            rotate=0,
-            blocks_arranged_in_reverse_order=False
-        )
+        device = max7219(serial, **MAX7219_OPTIONS)
         device.contrast(128)
+        # Identically configured twin whose output run_clock records and
+        # replays as raw register writes (see RegisterFrameCache)
+        device.register_recording = RecordingSerial()
+        device.register_recorder = max7219(device.register_recording, **MAX7219_OPTIONS)
         print("Running on hardware (MAX7219)")
 
+    # Pillow-SIMD reports versions with a ".postN" suffix
+    print(f"Using Pillow {PIL.__version__}")
+
     return device
 
 
-def format_time(dt):
+def local_hms():
     """
-    Format datetime as HH:MM:SS.
+    Return the current local (hour, minute, second) as plain ints.
 
-    Args:
-        dt: datetime object
-
-    Returns:
-        Formatted time string
+    Uses time.localtime() rather than building a datetime each tick. A leap
+    second (tm_sec == 60) is shown as :59.
     """
-    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    lt = time.localtime()
+    return lt.tm_hour, lt.tm_min, min(lt.tm_sec, 59)
 
 
 def run_clock(device):
     """
     Main clock loop - continuously update the display with current time.
-    Syncs updates to the exact second boundary for precise timing.
+    Sleeps until each second boundary instead of polling, so the display
+    updates once per second with a single wakeup. The emulator is driven
+    by Tk's scheduler and mainloop instead.
 
     Args:
         device: luma device instance
     """
     print("Starting clock display... Press Ctrl+C to exit.")
 
+    segments = SegmentCache(device.width, device.height)
+
     try:
-        last_second = -1
+        if isinstance(device, TkinterEmulator):
+            # Let Tk's own event loop drive updates instead of polling it, and
+            # hand it the row bitmasks directly rather than a PIL image
+            def tick():
+                device.display_rows(segments.frame_rows(*local_hms()))
+                device.schedule_tick(tick)
+
+            # Tk swallows exceptions raised in callbacks, so a KeyboardInterrupt
+            # would only stop the ticks. Quit the event loop on Ctrl+C instead.
+            previous = signal.signal(signal.SIGINT, lambda signum, frame: device.root.quit())
+            try:
+                tick()
+                device.root.mainloop()
+            finally:
+                signal.signal(signal.SIGINT, previous)
+
+            # Reached on Ctrl+C or when the window is closed
+            print("\nClock stopped.")
+            return
+
+        # The MAX7219 set up by get_device takes raw register writes; any
+        # other device gets images
+        recorder = getattr(device, 'register_recorder', None)
+        if recorder is not None:
+            write = RegisterFrameCache(
+                device, recorder, device.register_recording, segments
+            ).write
+        else:
+            def write(hour, minute, second):
+                device.display(segments.frame(hour, minute, second))
 
         while True:
-            now = datetime.now()
+            write(*local_hms())
 
-            # Only update display when the second changes
-            if now.second != last_second:
-                last_second = now.second
-                time_str = format_time(now)
-
-                with canvas(device) as draw:
-                    draw_time_string(draw, time_str, y_offset=0)
-
-            # Small sleep to avoid busy-waiting, but short enough to catch the change
-            time.sleep(0.01)
+            # Sleep until just past the next second boundary rather than polling
+            time.sleep(1.0 - (time.time() % 1.0) + SECOND_SLACK)
 
     except KeyboardInterrupt:
         print("\nClock stopped.")
 
 
-def main():
-    """Parse arguments and start the clock."""
+def parse_args(argv):
+    """
+    Parse command line arguments.
+
+    With no arguments (the usual systemd/boot case) the defaults are
+    returned directly, so argparse is only imported when actually needed.
+
+    Args:
+        argv: Arguments excluding the program name
+
+    Returns:
+        Namespace with emulator and brightness attributes
+    """
+    if not argv:
+        return SimpleNamespace(emulator=False, brightness=DEFAULT_BRIGHTNESS)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='NTP Clock Display for MAX7219 LED Matrix',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -294,13 +610,18 @@ Examples:
     parser.add_argument(
         '--brightness', '-b',
         type=int,
-        default=128,
+        default=DEFAULT_BRIGHTNESS,
         choices=range(0, 256),
         metavar='0-255',
-        help='Display brightness (0-255, default: 128)'
+        help='Display brightness (0-255, default: %(default)s)'
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    """Parse arguments and start the clock."""
+    args = parse_args(sys.argv[1:])
 
     try:
         device = get_device(emulator=args.emulator)